@@ -0,0 +1,70 @@
+"""
+Example of giving the voice agent tools to call.
+
+This example registers two stub lookups (orders and calendar) and runs the
+local voice agent with them. Try asking "Where is order 1234?" or
+"What's on my calendar tomorrow?".
+
+Make sure you have:
+1. Set up your .env file with required API keys
+2. Installed dependencies: pip install -r requirements.txt
+"""
+
+import asyncio
+
+from src.bot_local import run_local_voice_agent
+from src.config import Config
+from src.tools import ToolRegistry
+
+tools = ToolRegistry(interim_after=1.0)
+
+
+@tools.tool(
+    name="get_order_status",
+    description="Look up the shipping status of a customer's order.",
+    properties={
+        "order_id": {"type": "string", "description": "The order number"},
+    },
+    required=["order_id"],
+    cache_ttl=60.0,  # Order status rarely changes within a call
+)
+async def get_order_status(order_id: str):
+    """Pretend to query an order system."""
+    await asyncio.sleep(2.0)  # Slow enough to trigger the interim message
+    return {"order_id": order_id, "status": "shipped", "eta": "Thursday"}
+
+
+@tools.tool(
+    name="get_calendar_events",
+    description="List the user's calendar events for a given day.",
+    properties={
+        "day": {"type": "string", "description": "The day, e.g. 'today' or '2025-01-31'"},
+    },
+    required=["day"],
+    cache_ttl=30.0,
+)
+async def get_calendar_events(day: str):
+    """Pretend to query a calendar."""
+    await asyncio.sleep(0.3)
+    return {"day": day, "events": [{"time": "10:00", "title": "Team standup"}]}
+
+
+async def main():
+    """Run the local voice agent with tools."""
+    config = Config.from_env()
+
+    print(f"\n{'='*60}")
+    print(f"  Voice Agent - Tool Calling Example")
+    print(f"{'='*60}")
+    print(f"\nTools: {', '.join(tools.tools)}")
+    print(f"\nPress Ctrl+C to stop the agent\n")
+    print(f"{'='*60}\n")
+
+    await run_local_voice_agent(config, tools)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n\nAgent stopped by user")
@@ -0,0 +1,323 @@
+"""Voice agent engine shared by every transport."""
+
+import asyncio
+from typing import Any, Optional
+
+from openai import NOT_GIVEN
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.services.deepgram.stt import DeepgramSTTService
+from pipecat.services.deepgram.tts import DeepgramTTSService
+from pipecat.services.openai.llm import OpenAILLMService
+from pipecat.transports.base_transport import BaseTransport
+
+from src.config import Config
+from src.context import ContextTrimmer
+from src.tools import ToolRegistry, ToolSession
+from src.transports import create_transport
+from src.utils.logger import setup_logger
+from src.utils.memory import SessionMemoryTracker
+
+
+class VoiceAgent:
+    """
+    Voice agent that handles real-time conversations using Pipecat.
+
+    The STT -> LLM -> TTS pipeline is the same for every transport; only
+    the transport that carries audio in and out is pluggable.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        tools: Optional[ToolRegistry] = None,
+        transport: Optional[str] = None,
+        websocket: Optional[Any] = None,
+    ):
+        """
+        Initialize the voice agent.
+
+        Args:
+            config: Configuration object with API keys and settings
+            tools: Optional tools the LLM can call during the conversation
+            transport: Transport name, overriding config.transport
+            websocket: Accepted connection this session serves (websocket transport)
+        """
+        self.config = config
+        self.transport_name = transport or config.transport
+        self.websocket = websocket
+        self.logger = setup_logger("VoiceAgent", config.log_level)
+        self.transport: Optional[BaseTransport] = None
+        self.runner: Optional[PipelineRunner] = None
+        self.tools = tools
+        self.tool_session: Optional[ToolSession] = None
+        self.memory = SessionMemoryTracker(
+            self.logger,
+            budget_mb=config.session_memory_budget_mb,
+            trace=config.memory_profiling,
+        )
+
+    async def run(self):
+        """
+        Run the voice agent.
+
+        This sets up the Pipecat pipeline and starts processing audio.
+        """
+        try:
+            self.logger.info(f"Initializing voice agent ({self.transport_name} transport)...")
+            task = self.build_task()
+
+            # Each WebSocket connection is its own session; end it on hang-up
+            if self.transport_name == "websocket":
+                self._handle_websocket_client(self.transport, task)
+
+            # Create and configure runner (the WebSocket server handles signals itself)
+            self.runner = PipelineRunner(handle_sigint=self.transport_name != "websocket")
+
+            # Log connection info
+            self.logger.info(f"Voice agent ready!")
+            self._log_connection_info()
+
+            # Keep enforcing the memory budget while the conversation grows
+            budget_watch = asyncio.create_task(
+                self.memory.watch(lambda e: self._end_session(task, str(e)))
+            )
+
+            # Run the pipeline
+            try:
+                await self.runner.run(task)
+            finally:
+                budget_watch.cancel()
+
+        except Exception as e:
+            self.logger.error(f"Error running voice agent: {e}", exc_info=True)
+            raise
+
+    def build_task(self) -> PipelineTask:
+        """
+        Build the session's services and pipeline task.
+
+        Memory is recorded after each stage, and the session fails here if
+        it is already over its memory budget.
+
+        Returns:
+            Pipeline task ready to run
+
+        Raises:
+            RuntimeError: If the session exceeds its memory budget
+        """
+        self.memory.start()
+
+        # Initialize the transport that carries audio in and out
+        transport = create_transport(self.transport_name, self.config, self.websocket)
+        self.transport = transport
+        self.memory.record("transport")
+
+        # Initialize Speech-to-Text (Deepgram)
+        stt = DeepgramSTTService(api_key=self.config.deepgram_api_key)
+        self.memory.record("stt")
+
+        # Initialize LLM
+        llm = self._initialize_llm()
+        self.memory.record("llm")
+
+        # Initialize Text-to-Speech
+        tts = self._initialize_tts()
+        self.memory.record("tts")
+
+        # Create LLM context and message aggregators
+        context, context_aggregator = self._initialize_context(llm)
+        self.memory.record("context")
+
+        # Build the pipeline
+        # Audio Input -> STT -> User Aggregator -> LLM -> Assistant Aggregator -> TTS -> Audio Output
+        processors = [
+            transport.input(),  # Audio input from the transport
+            stt,  # Speech to text
+            context_aggregator.user(),  # Aggregate user messages
+        ]
+        if self.config.max_context_messages:
+            processors.append(ContextTrimmer(self.config.max_context_messages))  # Bound context size
+        processors += [
+            llm,  # Language model processing
+            tts,  # Text to speech
+            transport.output(),  # Audio output to the transport
+            context_aggregator.assistant(),  # Aggregate assistant messages and tool results
+        ]
+        pipeline = Pipeline(processors)
+
+        # Create pipeline task (metrics include per-tool latency)
+        task = PipelineTask(pipeline, params=PipelineParams(enable_metrics=True))
+        self.memory.record("pipeline")
+        self.memory.check_budget()
+
+        return task
+
+    def _handle_websocket_client(self, transport: BaseTransport, task: PipelineTask):
+        """End the session when the media server disconnects."""
+
+        @transport.event_handler("on_client_connected")
+        async def on_client_connected(transport, client):
+            self.logger.info("Media server connected")
+
+        @transport.event_handler("on_client_disconnected")
+        async def on_client_disconnected(transport, client):
+            self.logger.info("Media server disconnected, ending session")
+            await task.cancel()
+
+    async def _end_session(self, task: PipelineTask, reason: str):
+        """Cancel the running session."""
+        self.logger.error(f"Ending session: {reason}")
+        await task.cancel()
+
+    def _log_connection_info(self):
+        """Log how to reach the agent on the current transport."""
+        if self.transport_name == "daily":
+            self.logger.info(f"Room URL: {self.config.daily_room_url}")
+            self.logger.info(f"Join the room to start talking to the agent")
+
+        elif self.transport_name == "local":
+            self.logger.info(f"Speak into your microphone to start talking to the agent")
+            self.logger.info(f"Press Ctrl+C to stop")
+
+        elif self.transport_name == "websocket":
+            self.logger.info(f"Session started for media server connection")
+
+        elif self.transport_name == "file":
+            self.logger.info(f"Reading caller audio from {self.config.input_audio_file}")
+            if self.config.output_audio_file:
+                self.logger.info(f"Writing agent audio to {self.config.output_audio_file}")
+
+    def _initialize_llm(self):
+        """
+        Initialize the LLM service based on configuration.
+
+        Returns:
+            Configured LLM service
+
+        Raises:
+            ValueError: If LLM provider is not supported
+        """
+        llm_provider = self.config.get_llm_provider()
+
+        if llm_provider == "openai":
+            self.logger.info(f"Using OpenAI LLM: {self.config.openai_model}")
+            llm = OpenAILLMService(
+                api_key=self.config.openai_api_key,
+                model=self.config.openai_model,
+            )
+
+        elif llm_provider == "groq":
+            self.logger.info(f"Using Groq LLM: {self.config.groq_model}")
+            # Groq uses OpenAI-compatible API
+            llm = OpenAILLMService(
+                api_key=self.config.groq_api_key,
+                base_url="https://api.groq.com/openai/v1",
+                model=self.config.groq_model,
+            )
+
+        else:
+            raise ValueError(f"Unsupported LLM provider: {llm_provider}")
+
+        # Tool calls from one response run concurrently
+        if self.tools:
+            self.tool_session = self.tools.register_with(llm)
+
+        return llm
+
+    def _initialize_context(self, llm: OpenAILLMService):
+        """
+        Create the LLM context and its user/assistant aggregators.
+
+        The aggregators come from the LLM service so that function calls
+        and their results are written into the context.
+
+        Args:
+            llm: LLM service the context is used with
+
+        Returns:
+            Tuple of the context and its aggregator pair
+        """
+        context = OpenAILLMContext(
+            messages=[{"role": "system", "content": self.config.bot_instructions}],
+            tools=self.tools.tools_schema() if self.tools else NOT_GIVEN,
+        )
+        return context, llm.create_context_aggregator(context)
+
+    def _initialize_tts(self):
+        """
+        Initialize the TTS service based on configuration.
+
+        Returns:
+            Configured TTS service
+
+        Raises:
+            ValueError: If TTS provider is not supported
+        """
+        if self.config.tts_provider == "deepgram":
+            self.logger.info("Using Deepgram TTS")
+            return DeepgramTTSService(
+                api_key=self.config.deepgram_api_key,
+                voice="aura-asteria-en",  # Natural female voice
+            )
+
+        elif self.config.tts_provider == "elevenlabs":
+            self.logger.info("Using ElevenLabs TTS")
+            from pipecat.services.elevenlabs import ElevenLabsTTSService
+
+            return ElevenLabsTTSService(
+                api_key=self.config.elevenlabs_api_key,
+                voice_id=self.config.elevenlabs_voice_id or "21m00Tcm4TlvDq8ikWAM",  # Default voice
+            )
+
+        else:
+            raise ValueError(f"Unsupported TTS provider: {self.config.tts_provider}")
+
+    async def cleanup(self):
+        """Clean up resources."""
+        self.logger.info("Cleaning up voice agent...")
+        if self.runner:
+            try:
+                await self.runner.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping runner: {e}")
+        if self.tool_session:
+            self.tool_session.report()
+        self.memory.record("session end")
+        self.memory.report()
+        self.memory.stop()
+
+
+async def run_voice_agent(
+    config: Config,
+    tools: Optional[ToolRegistry] = None,
+    transport: Optional[str] = None,
+):
+    """
+    Run the voice agent with proper error handling and cleanup.
+
+    The WebSocket transport starts a server instead, which runs one
+    session per media server connection until the process is stopped.
+
+    Args:
+        config: Configuration object
+        tools: Optional tools the LLM can call during the conversation
+        transport: Transport name, overriding config.transport
+    """
+    if (transport or config.transport) == "websocket":
+        from src.server import run_websocket_server
+
+        await run_websocket_server(config, tools)
+        return
+
+    agent = VoiceAgent(config, tools, transport)
+    try:
+        await agent.run()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        await agent.cleanup()
@@ -13,10 +13,21 @@ class Config:
     # Deepgram Configuration (required)
     deepgram_api_key: str
 
+    # Transport Configuration
+    transport: str = "daily"  # Options: daily, local, websocket, file
+
     # Daily.co Configuration (optional - only needed for WebRTC mode)
     daily_api_key: Optional[str] = None
     daily_room_url: Optional[str] = None
 
+    # WebSocket Configuration (only needed for websocket transport)
+    websocket_host: str = "localhost"
+    websocket_port: int = 8765
+
+    # File Configuration (only needed for file transport)
+    input_audio_file: Optional[str] = None
+    output_audio_file: Optional[str] = None
+
     # LLM Configuration
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4o-mini"
@@ -35,6 +46,11 @@ class Config:
     # Logging
     log_level: str = "INFO"
 
+    # Memory
+    memory_profiling: bool = False  # Per-stage tracemalloc report for each session
+    session_memory_budget_mb: Optional[float] = None  # Max RSS growth per session
+    max_context_messages: Optional[int] = None  # Conversation messages kept in the LLM context
+
     @classmethod
     def from_env(cls) -> "Config":
         """
@@ -59,10 +75,25 @@ class Config:
                 "Please set it in your .env file or environment."
             )
 
+        # Transport configuration
+        transport = os.getenv("TRANSPORT", "daily")
+
         # Optional Daily.co fields (only needed for WebRTC mode)
         daily_api_key = os.getenv("DAILY_API_KEY")
         daily_room_url = os.getenv("DAILY_ROOM_URL")
 
+        # Optional WebSocket fields (only needed for websocket transport)
+        websocket_host = os.getenv("WEBSOCKET_HOST", "localhost")
+        websocket_port = os.getenv("WEBSOCKET_PORT", "8765")
+        try:
+            websocket_port = int(websocket_port)
+        except ValueError:
+            raise ValueError(f"WEBSOCKET_PORT must be an integer, got: {websocket_port}")
+
+        # Optional file fields (only needed for file transport)
+        input_audio_file = os.getenv("INPUT_AUDIO_FILE")
+        output_audio_file = os.getenv("OUTPUT_AUDIO_FILE")
+
         # Optional LLM configuration
         openai_api_key = os.getenv("OPENAI_API_KEY")
         openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
@@ -97,9 +128,30 @@ class Config:
         # Logging
         log_level = os.getenv("LOG_LEVEL", "INFO")
 
+        # Memory
+        memory_profiling = os.getenv("MEMORY_PROFILING", "false").lower() in ("1", "true", "yes")
+        session_memory_budget = os.getenv("SESSION_MEMORY_BUDGET_MB")
+        try:
+            session_memory_budget_mb = float(session_memory_budget) if session_memory_budget else None
+        except ValueError:
+            raise ValueError(
+                f"SESSION_MEMORY_BUDGET_MB must be a number, got: {session_memory_budget}"
+            )
+
+        max_context = os.getenv("MAX_CONTEXT_MESSAGES")
+        try:
+            max_context_messages = int(max_context) if max_context else None
+        except ValueError:
+            raise ValueError(f"MAX_CONTEXT_MESSAGES must be an integer, got: {max_context}")
+
         return cls(
+            transport=transport,
             daily_api_key=daily_api_key,
             daily_room_url=daily_room_url,
+            websocket_host=websocket_host,
+            websocket_port=websocket_port,
+            input_audio_file=input_audio_file,
+            output_audio_file=output_audio_file,
             deepgram_api_key=deepgram_api_key,
             openai_api_key=openai_api_key,
             openai_model=openai_model,
@@ -111,6 +163,9 @@ class Config:
             bot_name=bot_name,
             bot_instructions=bot_instructions,
             log_level=log_level,
+            memory_profiling=memory_profiling,
+            session_memory_budget_mb=session_memory_budget_mb,
+            max_context_messages=max_context_messages,
         )
 
     def get_llm_provider(self) -> str:
@@ -140,3 +195,27 @@ class Config:
                 f"Invalid TTS provider: {self.tts_provider}. "
                 f"Must be 'deepgram' or 'elevenlabs'"
             )
+
+        if self.transport not in ["daily", "local", "websocket", "file"]:
+            raise ValueError(
+                f"Invalid transport: {self.transport}. "
+                f"Must be 'daily', 'local', 'websocket' or 'file'"
+            )
+
+        if self.transport == "daily" and not self.daily_room_url:
+            raise ValueError("DAILY_ROOM_URL is required when TRANSPORT is set to 'daily'")
+
+        if self.transport == "file" and not self.input_audio_file:
+            raise ValueError("INPUT_AUDIO_FILE is required when TRANSPORT is set to 'file'")
+
+        if self.session_memory_budget_mb is not None and self.session_memory_budget_mb <= 0:
+            raise ValueError(
+                f"Invalid session memory budget: {self.session_memory_budget_mb}. "
+                f"Must be a positive number of megabytes"
+            )
+
+        if self.max_context_messages is not None and self.max_context_messages < 2:
+            raise ValueError(
+                f"Invalid max context messages: {self.max_context_messages}. "
+                f"Must be at least 2"
+            )
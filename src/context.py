@@ -0,0 +1,62 @@
+"""LLM context helpers for the voice agent."""
+
+from typing import Any, Dict, List
+
+from pipecat.frames.frames import Frame
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContextFrame
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+def trim_messages(messages: List[Dict[str, Any]], max_messages: int) -> List[Dict[str, Any]]:
+    """
+    Keep the system prompt and only the most recent conversation messages.
+
+    Tool results are never kept without the assistant message that
+    requested them, since the LLM API rejects orphaned tool messages.
+
+    Args:
+        messages: LLM context messages, oldest first
+        max_messages: Maximum number of non-system messages to keep
+
+    Returns:
+        The trimmed message list (the original list if nothing was dropped)
+    """
+    system = [m for m in messages if m.get("role") == "system"]
+    conversation = [m for m in messages if m.get("role") != "system"]
+    if len(conversation) <= max_messages:
+        return messages
+
+    recent = conversation[-max_messages:]
+    while recent and recent[0].get("role") == "tool":
+        recent = recent[1:]
+    return system + recent
+
+
+class ContextTrimmer(FrameProcessor):
+    """
+    Trim the LLM context before each completion.
+
+    The context otherwise keeps every message of the call, so long
+    conversations grow both session memory and per-turn token cost.
+    """
+
+    def __init__(self, max_messages: int, **kwargs):
+        """
+        Initialize the context trimmer.
+
+        Args:
+            max_messages: Maximum number of non-system messages to keep
+        """
+        super().__init__(**kwargs)
+        self._max_messages = max_messages
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, OpenAILLMContextFrame):
+            messages = frame.context.messages
+            trimmed = trim_messages(messages, self._max_messages)
+            if trimmed is not messages:
+                frame.context.set_messages(trimmed)
+
+        await self.push_frame(frame, direction)
@@ -21,6 +21,7 @@ def main():
 
         # Log configuration (without sensitive data)
         logger.info(f"Bot Name: {config.bot_name}")
+        logger.info(f"Transport: {config.transport}")
         logger.info(f"LLM Provider: {config.get_llm_provider()}")
         logger.info(f"TTS Provider: {config.tts_provider}")
         logger.info(f"Log Level: {config.log_level}")
@@ -34,7 +35,7 @@ def main():
         logger.info("\nPlease ensure you have:")
         logger.info("1. Created a .env file (copy from .env.example)")
         logger.info("2. Set all required API keys in your .env file")
-        logger.info("3. Created a Daily.co room and set the DAILY_ROOM_URL")
+        logger.info("3. For TRANSPORT=daily (default), created a Daily.co room and set the DAILY_ROOM_URL")
         sys.exit(1)
 
     except KeyboardInterrupt:
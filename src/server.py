@@ -0,0 +1,64 @@
+"""WebSocket server that runs one voice agent session per connection."""
+
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, WebSocket
+
+from src.agent import VoiceAgent
+from src.config import Config
+from src.tools import ToolRegistry
+from src.utils.logger import setup_logger
+
+
+def create_app(config: Config, tools: Optional[ToolRegistry] = None) -> FastAPI:
+    """
+    Create the FastAPI app that media servers connect to.
+
+    Every accepted connection gets its own VoiceAgent, so sessions run
+    concurrently and never share a context, tool cache or memory report.
+
+    Args:
+        config: Configuration object
+        tools: Optional tools the LLM can call during the conversation
+
+    Returns:
+        FastAPI app serving the ``/ws`` endpoint
+    """
+    app = FastAPI()
+
+    @app.websocket("/ws")
+    async def websocket_endpoint(websocket: WebSocket):
+        await websocket.accept()
+        agent = VoiceAgent(config, tools, transport="websocket", websocket=websocket)
+        try:
+            await agent.run()
+        except Exception:
+            pass  # Already logged by the agent; keep serving other callers
+        finally:
+            await agent.cleanup()
+
+    return app
+
+
+async def run_websocket_server(config: Config, tools: Optional[ToolRegistry] = None):
+    """
+    Serve voice agent sessions over WebSocket until the process is stopped.
+
+    Args:
+        config: Configuration object
+        tools: Optional tools the LLM can call during the conversation
+    """
+    logger = setup_logger("VoiceAgentServer", config.log_level)
+    logger.info(f"Listening on ws://{config.websocket_host}:{config.websocket_port}/ws")
+    logger.info("Connect your media server to start talking to the agent")
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(config, tools),
+            host=config.websocket_host,
+            port=config.websocket_port,
+            log_level=config.log_level.lower(),
+        )
+    )
+    await server.serve()
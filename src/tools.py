@@ -0,0 +1,326 @@
+"""Function calling (tools) for the voice agent's LLM stage."""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.frames.frames import MetricsFrame, TTSSpeakFrame
+from pipecat.metrics.metrics import ProcessingMetricsData
+from pipecat.services.llm_service import FunctionCallParams, LLMService
+
+ToolHandler = Callable[..., Awaitable[Any]]
+
+
+@dataclass
+class Tool:
+    """A function the LLM can call during a conversation."""
+
+    name: str
+    description: str
+    handler: ToolHandler
+    properties: Dict[str, Any] = field(default_factory=dict)
+    required: List[str] = field(default_factory=list)
+    cache_ttl: float = 0.0  # Seconds to reuse a result for identical arguments (0 disables)
+    interim_after: Optional[float] = None  # Overrides the registry's interim delay
+
+
+@dataclass(slots=True)
+class ToolStats:
+    """Latency and outcome counters for a single tool."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean latency of calls that actually ran the handler."""
+        executed = self.calls - self.cache_hits
+        return self.total_seconds / executed if executed else 0.0
+
+
+class ToolRegistry:
+    """
+    Registry of tools exposed to the LLM.
+
+    The registry only holds tool definitions and can be shared by every
+    session. Each agent gets its own ToolSession from ``register_with``,
+    which keeps that call's cache, in-flight calls and latency stats.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        interim_after: float = 1.0,
+        interim_message: str = "One moment while I look that up.",
+        max_cache_entries: int = 256,
+    ):
+        """
+        Initialize the tool registry.
+
+        Args:
+            logger: Logger for tool calls and the latency report
+            interim_after: Seconds before a slow tool triggers the interim message
+            interim_message: What the agent says while a slow tool finishes
+            max_cache_entries: Maximum cached results kept per session
+        """
+        self.logger = logger or logging.getLogger("ToolRegistry")
+        self.interim_after = interim_after
+        self.interim_message = interim_message
+        self.max_cache_entries = max_cache_entries
+        self.tools: Dict[str, Tool] = {}
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def register(self, tool: Tool) -> Tool:
+        """
+        Add a tool to the registry.
+
+        Args:
+            tool: Tool to register
+
+        Returns:
+            The registered tool
+
+        Raises:
+            ValueError: If a tool with the same name is already registered
+        """
+        if tool.name in self.tools:
+            raise ValueError(f"Tool already registered: {tool.name}")
+        self.tools[tool.name] = tool
+        return tool
+
+    def tool(
+        self,
+        name: str,
+        description: str,
+        properties: Optional[Dict[str, Any]] = None,
+        required: Optional[List[str]] = None,
+        cache_ttl: float = 0.0,
+        interim_after: Optional[float] = None,
+    ) -> Callable[[ToolHandler], ToolHandler]:
+        """
+        Decorator that registers an async function as a tool.
+
+        The function is called with the LLM's arguments as keyword arguments
+        and must return a JSON-serializable result.
+        """
+
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            self.register(
+                Tool(
+                    name=name,
+                    description=description,
+                    handler=handler,
+                    properties=properties or {},
+                    required=required or [],
+                    cache_ttl=cache_ttl,
+                    interim_after=interim_after,
+                )
+            )
+            return handler
+
+        return decorator
+
+    def tools_schema(self) -> ToolsSchema:
+        """
+        Build the tools schema to attach to the LLM context.
+
+        Returns:
+            Schema describing every registered tool
+        """
+        return ToolsSchema(
+            standard_tools=[
+                FunctionSchema(
+                    name=tool.name,
+                    description=tool.description,
+                    properties=tool.properties,
+                    required=tool.required,
+                )
+                for tool in self.tools.values()
+            ]
+        )
+
+    def register_with(self, llm: LLMService) -> "ToolSession":
+        """
+        Register every tool's handler with a session's LLM service.
+
+        Args:
+            llm: LLM service that will issue the function calls
+
+        Returns:
+            Per-session tool state (cache, in-flight calls and stats)
+        """
+        session = ToolSession(self)
+        for tool in self.tools.values():
+            llm.register_function(tool.name, session.make_handler(tool))
+        self.logger.info(f"Registered {len(self.tools)} tool(s): {', '.join(self.tools)}")
+        return session
+
+
+class ToolSession:
+    """
+    Tool state for a single conversation.
+
+    Tool calls issued in one LLM response run concurrently (pipecat starts
+    each call as its own task). Results are cached for the tool's
+    ``cache_ttl`` seconds, identical in-flight calls share one execution,
+    and a call that is still running after its interim delay makes the
+    agent speak a short holding message while it finishes. Nothing is
+    shared between sessions, so one caller never sees another's results.
+    """
+
+    def __init__(self, registry: ToolRegistry):
+        """
+        Initialize the tool session.
+
+        Args:
+            registry: Registry holding the tool definitions
+        """
+        self.registry = registry
+        self.logger = registry.logger
+        self.stats: Dict[str, ToolStats] = {name: ToolStats() for name in registry.tools}
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._slow_calls = 0
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Run a tool, using the cache and sharing identical in-flight calls.
+
+        Args:
+            name: Tool name
+            arguments: Arguments from the LLM
+
+        Returns:
+            The tool result
+        """
+        tool = self.registry.tools[name]
+        stats = self.stats[name]
+        stats.calls += 1
+
+        key = (name, json.dumps(arguments, sort_keys=True, default=str))
+        cached = self._cache.get(key)
+        if cached:
+            if cached[0] > time.monotonic():
+                stats.cache_hits += 1
+                self.logger.debug(f"Tool {name} cache hit")
+                return cached[1]
+            del self._cache[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(tool, arguments))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            stats.cache_hits += 1
+
+        # Shield so a cancelled caller does not cancel a call others are waiting on
+        result = await asyncio.shield(task)
+        if tool.cache_ttl > 0:
+            self._store(key, result, tool.cache_ttl)
+        return result
+
+    def _store(self, key: Tuple[str, str], result: Any, ttl: float) -> None:
+        """Cache a result, evicting expired and then oldest entries when full."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= self.registry.max_cache_entries:
+            now = time.monotonic()
+            for expired in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                del self._cache[expired]
+        while self._cache and len(self._cache) >= self.registry.max_cache_entries:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + ttl, result)
+
+    async def _run(self, tool: Tool, arguments: Dict[str, Any]) -> Any:
+        """Run a tool's handler and record its latency."""
+        stats = self.stats[tool.name]
+        start = time.monotonic()
+        try:
+            return await tool.handler(**arguments)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            self.logger.debug(f"Tool {tool.name} took {elapsed * 1000:.0f} ms")
+
+    def make_handler(self, tool: Tool) -> Callable[[FunctionCallParams], Awaitable[None]]:
+        """Create the pipecat function call handler for a tool."""
+        interim_after = (
+            tool.interim_after if tool.interim_after is not None else self.registry.interim_after
+        )
+
+        async def handler(params: FunctionCallParams):
+            start = time.monotonic()
+            call = asyncio.ensure_future(self.call(tool.name, dict(params.arguments)))
+            try:
+                try:
+                    result = await asyncio.wait_for(asyncio.shield(call), interim_after)
+                except asyncio.TimeoutError:
+                    # Keep the caller engaged while the slow tool finishes, but only
+                    # once when several parallel calls are slow at the same time
+                    speak = self._slow_calls == 0
+                    self._slow_calls += 1  # Claim before awaiting so parallel calls stay quiet
+                    try:
+                        if speak:
+                            await params.llm.push_frame(TTSSpeakFrame(self.registry.interim_message))
+                        result = await call
+                    finally:
+                        self._slow_calls -= 1
+            except asyncio.CancelledError:
+                call.cancel()
+                raise
+            except Exception as e:
+                self.logger.error(f"Tool {tool.name} failed: {e}", exc_info=True)
+                result = {"error": f"{tool.name} is unavailable right now"}
+
+            if params.llm.metrics_enabled:
+                # Latency as seen by the conversation, on pipecat's metrics path
+                await params.llm.push_frame(
+                    MetricsFrame(
+                        data=[
+                            ProcessingMetricsData(
+                                processor=f"tool:{tool.name}", value=time.monotonic() - start
+                            )
+                        ]
+                    )
+                )
+
+            await params.result_callback(result)
+
+        return handler
+
+    def get_stats(self) -> Dict[str, ToolStats]:
+        """
+        Get a snapshot of this session's per-tool stats.
+
+        Returns:
+            Copy of the stats for every tool, keyed by tool name
+        """
+        return {name: replace(stats) for name, stats in self.stats.items()}
+
+    def report(self) -> None:
+        """Log per-tool latency metrics."""
+        used = {name: stats for name, stats in self.stats.items() if stats.calls}
+        if not used:
+            return
+
+        self.logger.info("Tool latency report:")
+        for name, stats in used.items():
+            self.logger.info(
+                f"  {name}: {stats.calls} call(s), {stats.cache_hits} cached, "
+                f"{stats.errors} error(s), mean {stats.mean_seconds * 1000:.0f} ms, "
+                f"max {stats.max_seconds * 1000:.0f} ms"
+            )
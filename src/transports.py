@@ -0,0 +1,257 @@
+"""Transports the voice agent can run on.
+
+Each transport is imported lazily so that only the pipecat extras for the
+transport actually in use need to be installed.
+"""
+
+import asyncio
+import wave
+from typing import Any, Optional
+
+from pipecat.audio.utils import create_stream_resampler
+from pipecat.frames.frames import (
+    EndFrame,
+    EndTaskFrame,
+    ErrorFrame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import BaseTransport, TransportParams
+
+from src.config import Config
+
+
+def create_transport(name: str, config: Config, websocket: Optional[Any] = None) -> BaseTransport:
+    """
+    Create the transport used to carry audio in and out of the pipeline.
+
+    Args:
+        name: Transport name ("daily", "local", "websocket" or "file")
+        config: Configuration object
+        websocket: Accepted FastAPI WebSocket (websocket transport only)
+
+    Returns:
+        Configured transport
+
+    Raises:
+        ValueError: If the transport is not supported or its input is invalid
+    """
+    if name == "daily":
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+        from pipecat.transports.daily.transport import DailyParams, DailyTransport
+
+        return DailyTransport(
+            config.daily_room_url,
+            None,  # No token needed for development
+            config.bot_name,
+            DailyParams(
+                api_key=config.daily_api_key,
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                transcription_enabled=True,
+                vad_analyzer=SileroVADAnalyzer(),
+            ),
+        )
+
+    elif name == "local":
+        from pipecat.transports.local.audio import LocalAudioTransport, LocalAudioTransportParams
+
+        return LocalAudioTransport(
+            LocalAudioTransportParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+            )
+        )
+
+    elif name == "websocket":
+        if websocket is None:
+            raise ValueError(
+                "The websocket transport needs an accepted connection; serve it with src.server"
+            )
+
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+        from pipecat.serializers.protobuf import ProtobufFrameSerializer
+        from pipecat.transports.websocket.fastapi import (
+            FastAPIWebsocketParams,
+            FastAPIWebsocketTransport,
+        )
+
+        return FastAPIWebsocketTransport(
+            websocket=websocket,
+            params=FastAPIWebsocketParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                add_wav_header=False,
+                vad_analyzer=SileroVADAnalyzer(),
+                serializer=ProtobufFrameSerializer(),
+            ),
+        )
+
+    elif name == "file":
+        check_input_audio(config.input_audio_file)
+        return FileTransport(
+            FileTransportParams(
+                audio_in_enabled=True,
+                audio_out_enabled=config.output_audio_file is not None,
+                input_file=config.input_audio_file,
+                output_file=config.output_audio_file,
+            )
+        )
+
+    else:
+        raise ValueError(f"Unsupported transport: {name}")
+
+
+def check_input_audio(path: str) -> None:
+    """
+    Check that a file can be played by the file transport.
+
+    Args:
+        path: Path to the WAV file
+
+    Raises:
+        ValueError: If the file is missing or not mono 16-bit PCM WAV
+    """
+    try:
+        with wave.open(path, "rb") as wav:
+            if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+                raise ValueError(f"Input audio must be mono 16-bit PCM: {path}")
+    except FileNotFoundError:
+        raise ValueError(f"Input audio file not found: {path}")
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Input audio is not a valid WAV file: {path} ({e})")
+
+
+class FileTransportParams(TransportParams):
+    """Parameters for the file transport."""
+
+    input_file: str
+    output_file: Optional[str] = None
+    tail_silence_secs: float = 3.0  # Silence fed after the file so the bot can answer
+
+
+class FileInputTransport(BaseInputTransport):
+    """Feed a mono 16-bit PCM WAV file into the pipeline at real-time pace."""
+
+    def __init__(self, transport: BaseTransport, params: FileTransportParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+        self._params = params
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+        if not self._reader_task:
+            self._reader_task = self.create_task(self._read_file())
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self._cancel_reader()
+
+    async def cancel(self, frame):
+        await super().cancel(frame)
+        await self._cancel_reader()
+
+    async def _cancel_reader(self):
+        if self._reader_task:
+            await self.cancel_task(self._reader_task)
+            self._reader_task = None
+
+    async def _read_file(self):
+        try:
+            await self._play_file()
+        except Exception as e:
+            # Report the error but still end the session instead of hanging
+            await self.push_frame(
+                ErrorFrame(f"Error reading {self._params.input_file}: {e}"),
+                FrameDirection.UPSTREAM,
+            )
+
+        # Ask the task to end; an EndFrame pushed from inside the pipeline would not stop it
+        await self.push_frame(EndTaskFrame(), FrameDirection.UPSTREAM)
+
+    async def _play_file(self):
+        check_input_audio(self._params.input_file)
+        resampler = create_stream_resampler()
+
+        with wave.open(self._params.input_file, "rb") as wav:
+            file_rate = wav.getframerate()
+            chunk_frames = file_rate // 50  # 20 ms chunks
+            chunk_secs = chunk_frames / file_rate
+
+            while audio := wav.readframes(chunk_frames):
+                audio = await resampler.resample(audio, file_rate, self.sample_rate)
+                await self._push_chunk(audio, chunk_secs)
+
+        # Trailing silence lets STT finalize and the bot finish its reply
+        silence = b"\x00" * int(self.sample_rate * chunk_secs) * 2
+        for _ in range(int(self._params.tail_silence_secs / chunk_secs)):
+            await self._push_chunk(silence, chunk_secs)
+
+    async def _push_chunk(self, audio: bytes, duration: float):
+        await self.push_audio_frame(
+            InputAudioRawFrame(audio=audio, sample_rate=self.sample_rate, num_channels=1)
+        )
+        await asyncio.sleep(duration)
+
+
+class FileOutputTransport(BaseOutputTransport):
+    """Write the bot's audio to a 16-bit PCM WAV file."""
+
+    def __init__(self, transport: BaseTransport, params: FileTransportParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+        self._params = params
+        self._wav: Optional[wave.Wave_write] = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        if self._params.output_file and not self._wav:
+            self._wav = wave.open(self._params.output_file, "wb")
+            self._wav.setnchannels(self._params.audio_out_channels)
+            self._wav.setsampwidth(2)
+            self._wav.setframerate(self.sample_rate)
+        await self.set_transport_ready(frame)
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        self._close()
+
+    async def cancel(self, frame):
+        await super().cancel(frame)
+        self._close()
+
+    async def write_audio_frame(self, frame: OutputAudioRawFrame) -> bool:
+        if self._wav:
+            self._wav.writeframes(frame.audio)
+        return True
+
+    def _close(self):
+        if self._wav:
+            self._wav.close()
+            self._wav = None
+
+
+class FileTransport(BaseTransport):
+    """Transport that reads caller audio from a WAV file, for testing the agent offline."""
+
+    def __init__(self, params: FileTransportParams, **kwargs):
+        super().__init__(**kwargs)
+        self._params = params
+        self._input: Optional[FileInputTransport] = None
+        self._output: Optional[FileOutputTransport] = None
+
+    def input(self) -> FileInputTransport:
+        if not self._input:
+            self._input = FileInputTransport(self, self._params, name=self._input_name)
+        return self._input
+
+    def output(self) -> FileOutputTransport:
+        if not self._output:
+            self._output = FileOutputTransport(self, self._params, name=self._output_name)
+        return self._output
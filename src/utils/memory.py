@@ -0,0 +1,215 @@
+"""Per-session memory accounting for the voice agent."""
+
+import asyncio
+import logging
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+# tracemalloc is process-global, so overlapping sessions share one trace
+_tracing_sessions = 0
+_owns_tracing = False
+
+
+def _acquire_tracing() -> None:
+    """Start tracemalloc for the first tracing session in the process."""
+    global _tracing_sessions, _owns_tracing
+    if _tracing_sessions == 0 and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _owns_tracing = True
+    _tracing_sessions += 1
+
+
+def _release_tracing() -> None:
+    """Stop tracemalloc once the last tracing session has finished."""
+    global _tracing_sessions, _owns_tracing
+    _tracing_sessions -= 1
+    if _tracing_sessions == 0 and _owns_tracing:
+        tracemalloc.stop()
+        _owns_tracing = False
+
+
+def get_rss_bytes() -> Optional[int]:
+    """
+    Get the resident set size of the current process.
+
+    Returns:
+        RSS in bytes, or None if it cannot be determined on this platform
+    """
+    # Linux: current RSS from /proc (second field of statm, in pages)
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    # macOS/BSD: fall back to peak RSS, which is an upper bound
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass(slots=True)
+class StageSample:
+    """Memory usage recorded after a pipeline stage was constructed."""
+
+    stage: str
+    traced_bytes: int
+    rss_bytes: Optional[int]
+
+
+class SessionMemoryTracker:
+    """
+    Track memory allocated while building and running a single session.
+
+    Each call to ``record`` stores how much Python memory (via tracemalloc)
+    and process RSS has grown since the tracker was started, so the report
+    shows what each pipeline stage costs per session.
+
+    Both measurements are process-wide: when several sessions run in the
+    same process, growth from the others is included.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        budget_mb: Optional[float] = None,
+        trace: bool = False,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            logger: Logger used for the memory report
+            budget_mb: Maximum RSS growth allowed per session, in megabytes
+            trace: Whether to collect tracemalloc snapshots per stage
+        """
+        self.logger = logger
+        self.budget_mb = budget_mb
+        self.trace = trace
+        self.samples: List[StageSample] = []
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_rss: Optional[int] = None
+        self._tracing = False
+
+    def start(self) -> None:
+        """Record the baseline before any session state is allocated."""
+        if self.trace and not self._tracing:
+            _acquire_tracing()
+            self._tracing = True
+            self._baseline = tracemalloc.take_snapshot()
+        self._baseline_rss = get_rss_bytes()
+
+    def record(self, stage: str) -> None:
+        """
+        Record memory usage after a pipeline stage has been created.
+
+        Args:
+            stage: Name of the stage (e.g. "transport", "stt", "llm")
+        """
+        traced_bytes = 0
+        if self._tracing and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            stats = snapshot.compare_to(self._baseline, "filename")
+            traced_bytes = sum(stat.size_diff for stat in stats)
+
+        self.samples.append(
+            StageSample(stage, traced_bytes, self.rss_growth_bytes())
+        )
+
+    def rss_growth_bytes(self) -> Optional[int]:
+        """
+        Get RSS growth since the tracker was started.
+
+        Returns:
+            Growth in bytes, or None if RSS is unavailable
+        """
+        rss = get_rss_bytes()
+        if rss is None or self._baseline_rss is None:
+            return None
+        return rss - self._baseline_rss
+
+    def check_budget(self) -> None:
+        """
+        Enforce the per-session RSS budget.
+
+        Raises:
+            RuntimeError: If the session grew beyond its memory budget
+        """
+        if self.budget_mb is None:
+            return
+
+        growth = self.rss_growth_bytes()
+        if growth is None:
+            self.logger.debug("RSS unavailable on this platform, skipping memory budget check")
+            return
+
+        growth_mb = growth / (1024 * 1024)
+        if growth_mb > self.budget_mb:
+            raise RuntimeError(
+                f"Session memory budget exceeded: {growth_mb:.1f} MB used, "
+                f"budget is {self.budget_mb:.1f} MB"
+            )
+
+    async def watch(
+        self,
+        on_exceeded: Callable[[RuntimeError], Awaitable[None]],
+        interval: float = 5.0,
+    ) -> None:
+        """
+        Check the budget periodically while the session runs.
+
+        Args:
+            on_exceeded: Called once with the error when the budget is exceeded
+            interval: Seconds between checks
+        """
+        if self.budget_mb is None:
+            return
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.check_budget()
+            except RuntimeError as e:
+                await on_exceeded(e)
+                return
+
+    def report(self) -> None:
+        """Log the per-stage memory report."""
+        if not self.samples:
+            return
+
+        self.logger.info("Session memory report:")
+        previous_traced = 0
+        previous_rss = 0
+        for sample in self.samples:
+            line = f"  {sample.stage:<12}"
+            if self.trace:
+                line += f" python +{_format_mb(sample.traced_bytes - previous_traced)}"
+                previous_traced = sample.traced_bytes
+            if sample.rss_bytes is not None:
+                line += f" rss +{_format_mb(sample.rss_bytes - previous_rss)}"
+                previous_rss = sample.rss_bytes
+            self.logger.info(line)
+
+        total = self.samples[-1]
+        if total.rss_bytes is not None:
+            self.logger.info(f"  {'total':<12} rss +{_format_mb(total.rss_bytes)}")
+
+    def stop(self) -> None:
+        """Release tracing; tracemalloc stops when no session still needs it."""
+        if self._tracing:
+            _release_tracing()
+            self._tracing = False
+
+
+def _format_mb(num_bytes: int) -> str:
+    """Format a byte count as megabytes."""
+    return f"{num_bytes / (1024 * 1024):.2f} MB"
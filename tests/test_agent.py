@@ -0,0 +1,85 @@
+"""Tests for the voice agent's pipeline wiring."""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("pipecat")
+pytest.importorskip("deepgram")
+pytest.importorskip("openai")
+
+from pipecat.frames.frames import EndFrame, FunctionCallInProgressFrame, FunctionCallResultFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+
+from src.agent import VoiceAgent
+from src.config import Config
+from src.tools import ToolRegistry
+
+
+def make_agent():
+    tools = ToolRegistry()
+
+    @tools.tool(name="get_order_status", description="Order status")
+    async def get_order_status(order_id: str):
+        return {"order_id": order_id, "status": "shipped"}
+
+    config = Config(deepgram_api_key="deepgram-key", openai_api_key="openai-key", transport="local")
+    return VoiceAgent(config, tools)
+
+
+def test_function_call_result_reaches_context():
+    agent = make_agent()
+
+    async def scenario():
+        llm = agent._initialize_llm()
+        context, context_aggregator = agent._initialize_context(llm)
+
+        task = PipelineTask(Pipeline([context_aggregator.assistant()]))
+        arguments = {"order_id": "1234"}
+        await task.queue_frames(
+            [
+                FunctionCallInProgressFrame(
+                    function_name="get_order_status",
+                    tool_call_id="call_1",
+                    arguments=arguments,
+                ),
+                FunctionCallResultFrame(
+                    function_name="get_order_status",
+                    tool_call_id="call_1",
+                    arguments=arguments,
+                    result={"order_id": "1234", "status": "shipped"},
+                    run_llm=False,
+                ),
+                EndFrame(),
+            ]
+        )
+        await asyncio.wait_for(PipelineRunner(handle_sigint=False).run(task), timeout=10)
+        return context
+
+    context = asyncio.run(scenario())
+
+    roles = [message["role"] for message in context.messages]
+    assert roles == ["system", "assistant", "tool"]
+
+    tool_call = context.messages[1]["tool_calls"][0]
+    assert tool_call["id"] == "call_1"
+    assert tool_call["function"]["name"] == "get_order_status"
+
+    result = context.messages[2]
+    assert result["tool_call_id"] == "call_1"
+    assert json.loads(result["content"])["status"] == "shipped"
+
+
+def test_context_carries_system_prompt_and_tools():
+    agent = make_agent()
+
+    async def scenario():
+        return agent._initialize_context(agent._initialize_llm())
+
+    context, _ = asyncio.run(scenario())
+
+    assert context.messages == [{"role": "system", "content": agent.config.bot_instructions}]
+    assert "get_order_status" in str(context.tools)
@@ -0,0 +1,92 @@
+"""Tests for configuration loading and validation."""
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from src.config import Config
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    """Minimal valid environment, isolated from any local .env file."""
+    monkeypatch.chdir(tmp_path)
+    for name in (
+        "TRANSPORT",
+        "DAILY_ROOM_URL",
+        "WEBSOCKET_PORT",
+        "INPUT_AUDIO_FILE",
+        "MAX_CONTEXT_MESSAGES",
+        "SESSION_MEMORY_BUDGET_MB",
+        "GROQ_API_KEY",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "deepgram-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-key")
+    return monkeypatch
+
+
+def make_config(**kwargs):
+    return Config(deepgram_api_key="deepgram-key", openai_api_key="openai-key", **kwargs)
+
+
+def test_from_env_defaults_to_daily(env):
+    config = Config.from_env()
+    assert config.transport == "daily"
+    assert config.websocket_port == 8765
+
+
+def test_from_env_reads_transport_settings(env):
+    env.setenv("TRANSPORT", "websocket")
+    env.setenv("WEBSOCKET_PORT", "9000")
+    env.setenv("MAX_CONTEXT_MESSAGES", "40")
+
+    config = Config.from_env()
+
+    assert config.transport == "websocket"
+    assert config.websocket_port == 9000
+    assert config.max_context_messages == 40
+
+
+def test_from_env_rejects_invalid_port(env):
+    env.setenv("WEBSOCKET_PORT", "not-a-port")
+    with pytest.raises(ValueError, match="WEBSOCKET_PORT"):
+        Config.from_env()
+
+
+def test_from_env_rejects_invalid_memory_budget(env):
+    env.setenv("SESSION_MEMORY_BUDGET_MB", "lots")
+    with pytest.raises(ValueError, match="SESSION_MEMORY_BUDGET_MB"):
+        Config.from_env()
+
+
+def test_validate_rejects_unknown_transport():
+    with pytest.raises(ValueError, match="Invalid transport"):
+        make_config(transport="carrier-pigeon").validate()
+
+
+def test_validate_daily_requires_room_url():
+    with pytest.raises(ValueError, match="DAILY_ROOM_URL"):
+        make_config(transport="daily").validate()
+    make_config(transport="daily", daily_room_url="https://example.daily.co/room").validate()
+
+
+def test_validate_file_requires_input_audio():
+    with pytest.raises(ValueError, match="INPUT_AUDIO_FILE"):
+        make_config(transport="file").validate()
+    make_config(transport="file", input_audio_file="caller.wav").validate()
+
+
+@pytest.mark.parametrize("transport", ["local", "websocket"])
+def test_validate_accepts_transports_without_extra_settings(transport):
+    make_config(transport=transport).validate()
+
+
+def test_validate_rejects_non_positive_memory_budget():
+    with pytest.raises(ValueError, match="memory budget"):
+        make_config(transport="local", session_memory_budget_mb=0).validate()
+
+
+def test_validate_rejects_tiny_context_limit():
+    with pytest.raises(ValueError, match="max context messages"):
+        make_config(transport="local", max_context_messages=1).validate()
@@ -0,0 +1,199 @@
+"""Tests for per-session memory accounting."""
+
+import asyncio
+import logging
+import tracemalloc
+import wave
+
+import pytest
+
+from src.utils.memory import SessionMemoryTracker, get_rss_bytes
+
+# Per-session RSS budget we size containers for
+SESSION_BUDGET_MB = 50
+
+# Sessions built to measure the per-session increment
+SESSIONS = 5
+
+logger = logging.getLogger("test_memory")
+
+requires_rss = pytest.mark.skipif(get_rss_bytes() is None, reason="RSS unavailable on this platform")
+
+
+def build_conversation(turns: int):
+    """LLM context messages for a conversation of the given length."""
+    messages = [{"role": "system", "content": "You are a helpful AI voice assistant."}]
+    for turn in range(turns):
+        messages.append({"role": "user", "content": f"Question {turn} " + "word " * 40})
+        messages.append({"role": "assistant", "content": f"Answer {turn} " + "word " * 60})
+    return messages
+
+
+@requires_rss
+def test_voice_agent_sessions_stay_within_rss_budget(tmp_path):
+    pytest.importorskip("pipecat")
+    pytest.importorskip("deepgram")
+    pytest.importorskip("openai")
+    from src.agent import VoiceAgent
+    from src.config import Config
+
+    input_file = tmp_path / "caller.wav"
+    with wave.open(str(input_file), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * 1600)
+
+    # Dummy keys: building the services does not touch the network
+    config = Config(
+        deepgram_api_key="deepgram-key",
+        openai_api_key="openai-key",
+        transport="file",
+        input_audio_file=str(input_file),
+        session_memory_budget_mb=SESSION_BUDGET_MB,
+    )
+
+    async def build_sessions():
+        # The first session pays one-off import and client setup costs
+        VoiceAgent(config).build_task()
+
+        rss_before = get_rss_bytes()
+        agents = [VoiceAgent(config) for _ in range(SESSIONS)]
+        for agent in agents:
+            agent.build_task()  # Raises if the session is over budget
+        return agents, get_rss_bytes() - rss_before
+
+    agents, growth = asyncio.run(build_sessions())
+
+    assert [sample.stage for sample in agents[0].memory.samples] == [
+        "transport",
+        "stt",
+        "llm",
+        "tts",
+        "context",
+        "pipeline",
+    ]
+    per_session_mb = growth / SESSIONS / (1024 * 1024)
+    assert per_session_mb < SESSION_BUDGET_MB
+
+
+@requires_rss
+def test_check_budget_raises_when_exceeded():
+    tracker = SessionMemoryTracker(logger, budget_mb=1)
+    tracker.start()
+    ballast = b"x" * (32 * 1024 * 1024)
+
+    with pytest.raises(RuntimeError, match="Session memory budget exceeded"):
+        tracker.check_budget()
+    del ballast
+
+
+def test_check_budget_without_budget_is_noop():
+    tracker = SessionMemoryTracker(logger)
+    tracker.start()
+    tracker.check_budget()
+
+
+def test_record_stores_stage_samples():
+    tracker = SessionMemoryTracker(logger, trace=True)
+    tracker.start()
+    try:
+        data = [0] * 100_000
+        tracker.record("llm")
+        tracker.record("tts")
+    finally:
+        tracker.stop()
+
+    assert [sample.stage for sample in tracker.samples] == ["llm", "tts"]
+    assert tracker.samples[0].traced_bytes > 0
+    del data
+
+
+def test_report_logs_each_stage(caplog):
+    tracker = SessionMemoryTracker(logger, trace=True)
+    tracker.start()
+    try:
+        tracker.record("transport")
+        tracker.record("pipeline")
+    finally:
+        tracker.stop()
+
+    with caplog.at_level(logging.INFO, logger="test_memory"):
+        tracker.report()
+
+    assert "Session memory report:" in caplog.text
+    assert "transport" in caplog.text
+    assert "pipeline" in caplog.text
+
+
+def test_report_without_samples_logs_nothing(caplog):
+    with caplog.at_level(logging.INFO, logger="test_memory"):
+        SessionMemoryTracker(logger).report()
+    assert caplog.text == ""
+
+
+def test_overlapping_sessions_keep_tracing():
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc already started outside the tracker")
+
+    first = SessionMemoryTracker(logger, trace=True)
+    second = SessionMemoryTracker(logger, trace=True)
+    first.start()
+    second.start()
+
+    first.stop()
+    assert tracemalloc.is_tracing()
+    second.record("session end")
+
+    second.stop()
+    assert not tracemalloc.is_tracing()
+
+
+@requires_rss
+def test_watch_reports_exceeded_budget():
+    tracker = SessionMemoryTracker(logger, budget_mb=1)
+    tracker.start()
+    ballast = b"x" * (32 * 1024 * 1024)
+    errors = []
+
+    async def on_exceeded(error):
+        errors.append(error)
+
+    asyncio.run(asyncio.wait_for(tracker.watch(on_exceeded, interval=0.01), timeout=5))
+
+    assert len(errors) == 1
+    del ballast
+
+
+def import_trim_messages():
+    """Import trim_messages, which lives with the pipecat context processor."""
+    return pytest.importorskip("src.context").trim_messages
+
+
+def test_trim_messages_keeps_system_and_recent():
+    trim_messages = import_trim_messages()
+    messages = build_conversation(turns=10)
+    trimmed = trim_messages(messages, 4)
+
+    assert trimmed[0]["role"] == "system"
+    assert trimmed[1:] == messages[-4:]
+
+
+def test_trim_messages_drops_orphaned_tool_results():
+    trim_messages = import_trim_messages()
+    messages = [
+        {"role": "system", "content": "prompt"},
+        {"role": "user", "content": "where is my order?"},
+        {"role": "assistant", "tool_calls": [{"id": "1"}]},
+        {"role": "tool", "tool_call_id": "1", "content": "shipped"},
+        {"role": "assistant", "content": "It shipped."},
+    ]
+    trimmed = trim_messages(messages, 2)
+
+    assert [m["role"] for m in trimmed] == ["system", "assistant"]
+
+
+def test_trim_messages_returns_short_context_unchanged():
+    trim_messages = import_trim_messages()
+    messages = build_conversation(turns=2)
+    assert trim_messages(messages, 10) is messages
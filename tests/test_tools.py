@@ -0,0 +1,263 @@
+"""Tests for LLM tool calling."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pipecat")
+
+from pipecat.frames.frames import MetricsFrame, TTSSpeakFrame
+
+from src.tools import ToolRegistry, ToolSession, ToolStats
+
+
+class FakeLLM:
+    """Stand-in for an LLM service that records handlers and pushed frames."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.frames = []
+        self.metrics_enabled = True
+
+    def register_function(self, name, handler):
+        self.handlers[name] = handler
+
+    async def push_frame(self, frame):
+        await asyncio.sleep(0)  # Yield like a real pipeline push
+        self.frames.append(frame)
+
+
+def make_registry(**kwargs):
+    registry = ToolRegistry(**kwargs)
+    runs = []
+
+    @registry.tool(name="get_order_status", description="Order status", cache_ttl=60.0)
+    async def get_order_status(order_id: str):
+        runs.append(("order", order_id))
+        await asyncio.sleep(0.05)
+        return {"order_id": order_id, "status": "shipped"}
+
+    @registry.tool(name="get_calendar_events", description="Calendar events")
+    async def get_calendar_events(day: str):
+        runs.append(("calendar", day))
+        await asyncio.sleep(0.2)
+        return {"day": day, "events": []}
+
+    @registry.tool(name="broken", description="Always fails")
+    async def broken():
+        raise RuntimeError("backend down")
+
+    return registry, runs
+
+
+async def invoke(llm, name, arguments):
+    """Invoke a registered handler the way pipecat does and return its result."""
+    results = []
+
+    async def result_callback(result):
+        results.append(result)
+
+    await llm.handlers[name](
+        SimpleNamespace(arguments=arguments, llm=llm, result_callback=result_callback)
+    )
+    return results[0]
+
+
+def test_cache_hit_within_ttl():
+    registry, runs = make_registry()
+    session = ToolSession(registry)
+
+    async def scenario():
+        first = await session.call("get_order_status", {"order_id": "1234"})
+        second = await session.call("get_order_status", {"order_id": "1234"})
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second
+    assert runs == [("order", "1234")]
+    assert session.stats["get_order_status"].cache_hits == 1
+
+
+def test_cache_entry_expires():
+    registry, runs = make_registry()
+    registry.tools["get_order_status"].cache_ttl = 0.01
+    session = ToolSession(registry)
+
+    async def scenario():
+        await session.call("get_order_status", {"order_id": "1234"})
+        await asyncio.sleep(0.05)
+        await session.call("get_order_status", {"order_id": "1234"})
+
+    asyncio.run(scenario())
+
+    assert runs == [("order", "1234"), ("order", "1234")]
+
+
+def test_cache_is_capped():
+    registry, _ = make_registry(max_cache_entries=2)
+    session = ToolSession(registry)
+
+    async def scenario():
+        for order_id in ("1", "2", "3"):
+            await session.call("get_order_status", {"order_id": order_id})
+
+    asyncio.run(scenario())
+
+    assert len(session._cache) == 2
+
+
+def test_sessions_do_not_share_results():
+    registry, runs = make_registry()
+    caller_a = ToolSession(registry)
+    caller_b = ToolSession(registry)
+
+    async def scenario():
+        await caller_a.call("get_order_status", {"order_id": "1234"})
+        await caller_b.call("get_order_status", {"order_id": "1234"})
+
+    asyncio.run(scenario())
+
+    assert runs == [("order", "1234"), ("order", "1234")]
+
+
+def test_identical_in_flight_calls_share_one_execution():
+    registry, runs = make_registry()
+    session = ToolSession(registry)
+
+    async def scenario():
+        return await asyncio.gather(
+            session.call("get_calendar_events", {"day": "today"}),
+            session.call("get_calendar_events", {"day": "today"}),
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second
+    assert runs == [("calendar", "today")]
+
+
+def test_different_calls_run_concurrently():
+    registry, runs = make_registry()
+    session = ToolSession(registry)
+
+    async def scenario():
+        start = time.monotonic()
+        await asyncio.gather(
+            session.call("get_calendar_events", {"day": "today"}),
+            session.call("get_calendar_events", {"day": "tomorrow"}),
+        )
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(scenario())
+
+    assert len(runs) == 2
+    assert elapsed < 0.35  # Sequential would take at least 0.4 s
+
+
+def test_failing_tool_returns_error_result():
+    registry, _ = make_registry()
+    llm = FakeLLM()
+    session = registry.register_with(llm)
+
+    result = asyncio.run(invoke(llm, "broken", {}))
+
+    assert "error" in result
+    assert session.stats["broken"].errors == 1
+
+
+def test_interim_message_spoken_once_for_parallel_slow_calls():
+    registry, _ = make_registry(interim_after=0.01)
+    llm = FakeLLM()
+    registry.register_with(llm)
+
+    async def scenario():
+        return await asyncio.gather(
+            invoke(llm, "get_calendar_events", {"day": "today"}),
+            invoke(llm, "get_calendar_events", {"day": "tomorrow"}),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [r["day"] for r in results] == ["today", "tomorrow"]
+    speak_frames = [f for f in llm.frames if isinstance(f, TTSSpeakFrame)]
+    assert len(speak_frames) == 1
+    assert speak_frames[0].text == registry.interim_message
+
+
+def test_fast_call_has_no_interim_message():
+    registry, _ = make_registry(interim_after=1.0)
+    llm = FakeLLM()
+    registry.register_with(llm)
+
+    asyncio.run(invoke(llm, "get_order_status", {"order_id": "1234"}))
+
+    assert not [f for f in llm.frames if isinstance(f, TTSSpeakFrame)]
+
+
+def test_each_call_emits_latency_metrics():
+    registry, _ = make_registry()
+    llm = FakeLLM()
+    registry.register_with(llm)
+
+    async def scenario():
+        await invoke(llm, "get_calendar_events", {"day": "today"})
+        await invoke(llm, "broken", {})
+
+    asyncio.run(scenario())
+
+    metrics = [data for f in llm.frames if isinstance(f, MetricsFrame) for data in f.data]
+    assert [m.processor for m in metrics] == ["tool:get_calendar_events", "tool:broken"]
+    assert metrics[0].value >= 0.2
+
+
+def test_no_metrics_frames_when_metrics_disabled():
+    registry, _ = make_registry()
+    llm = FakeLLM()
+    llm.metrics_enabled = False
+    registry.register_with(llm)
+
+    asyncio.run(invoke(llm, "get_order_status", {"order_id": "1234"}))
+
+    assert not [f for f in llm.frames if isinstance(f, MetricsFrame)]
+
+
+def test_get_stats_returns_snapshot():
+    registry, _ = make_registry()
+    session = ToolSession(registry)
+
+    asyncio.run(session.call("get_order_status", {"order_id": "1"}))
+    snapshot = session.get_stats()
+    snapshot["get_order_status"].calls = 99
+
+    assert session.get_stats()["get_order_status"].calls == 1
+
+
+def test_stats_record_latency():
+    registry, _ = make_registry()
+    session = ToolSession(registry)
+
+    async def scenario():
+        await session.call("get_calendar_events", {"day": "today"})
+        await session.call("get_order_status", {"order_id": "1"})
+        await session.call("get_order_status", {"order_id": "1"})
+
+    asyncio.run(scenario())
+
+    calendar = session.stats["get_calendar_events"]
+    assert calendar.calls == 1
+    assert calendar.max_seconds >= 0.2
+    assert calendar.mean_seconds == pytest.approx(calendar.total_seconds)
+
+    order = session.stats["get_order_status"]
+    assert order.calls == 2
+    assert order.cache_hits == 1
+    assert order.mean_seconds == pytest.approx(order.total_seconds)
+
+
+def test_tool_stats_mean_excludes_cache_hits():
+    stats = ToolStats(calls=3, cache_hits=1, total_seconds=0.3, max_seconds=0.2)
+    assert stats.mean_seconds == pytest.approx(0.15)
+    assert ToolStats().mean_seconds == 0.0
@@ -0,0 +1,105 @@
+"""Tests for agent transports."""
+
+import asyncio
+import wave
+
+import pytest
+
+pytest.importorskip("pipecat")
+pytest.importorskip("dotenv")
+
+from pipecat.frames.frames import Frame, InputAudioRawFrame, OutputAudioRawFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from src.config import Config
+from src.transports import FileTransport, FileTransportParams, create_transport
+
+
+def write_wav(path, seconds=0.2, sample_rate=16000, channels=1):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x01\x00" * int(sample_rate * seconds) * channels)
+
+
+def make_config(**kwargs):
+    return Config(deepgram_api_key="deepgram-key", openai_api_key="openai-key", **kwargs)
+
+
+class Echo(FrameProcessor):
+    """Send caller audio straight back out, standing in for STT -> LLM -> TTS."""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InputAudioRawFrame):
+            frame = OutputAudioRawFrame(
+                audio=frame.audio, sample_rate=frame.sample_rate, num_channels=frame.num_channels
+            )
+        await self.push_frame(frame, direction)
+
+
+def test_file_transport_plays_input_and_writes_output(tmp_path):
+    input_file = tmp_path / "caller.wav"
+    output_file = tmp_path / "agent.wav"
+    write_wav(input_file)
+
+    transport = FileTransport(
+        FileTransportParams(
+            audio_in_enabled=True,
+            audio_out_enabled=True,
+            input_file=str(input_file),
+            output_file=str(output_file),
+            tail_silence_secs=0.1,
+        )
+    )
+
+    async def scenario():
+        task = PipelineTask(Pipeline([transport.input(), Echo(), transport.output()]))
+        runner = PipelineRunner(handle_sigint=False)
+
+        # The session must end on its own once the file has been played
+        await asyncio.wait_for(runner.run(task), timeout=10)
+
+    asyncio.run(scenario())
+
+    with wave.open(str(output_file), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getnframes() > 0
+
+
+def test_create_transport_rejects_unknown_transport():
+    with pytest.raises(ValueError, match="Unsupported transport"):
+        create_transport("carrier-pigeon", make_config())
+
+
+def test_create_transport_rejects_missing_input_file(tmp_path):
+    config = make_config(transport="file", input_audio_file=str(tmp_path / "missing.wav"))
+    with pytest.raises(ValueError, match="not found"):
+        create_transport("file", config)
+
+
+def test_create_transport_rejects_stereo_input(tmp_path):
+    input_file = tmp_path / "stereo.wav"
+    write_wav(input_file, channels=2)
+
+    config = make_config(transport="file", input_audio_file=str(input_file))
+    with pytest.raises(ValueError, match="mono 16-bit"):
+        create_transport("file", config)
+
+
+def test_create_transport_builds_file_transport(tmp_path):
+    input_file = tmp_path / "caller.wav"
+    write_wav(input_file)
+
+    config = make_config(transport="file", input_audio_file=str(input_file))
+    assert isinstance(create_transport("file", config), FileTransport)
+
+
+def test_create_transport_websocket_requires_connection():
+    with pytest.raises(ValueError, match="accepted connection"):
+        create_transport("websocket", make_config(transport="websocket"))